@@ -2,14 +2,13 @@
 
 import argparse
 import asyncio
-import json
+import heapq
 import logging
 import sys
+from operator import attrgetter
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import msgspec
-
 from .crawler import WikipediaGDPCrawler
 from .models import CountryStats
 
@@ -86,57 +85,61 @@ def print_summary(data: Dict[str, CountryStats], top_n: int = 10) -> None:
         data: Dictionary mapping country names to their GDP stats
         top_n: Number of top countries to display
     """
+    # Collect every line first and write once instead of per-line prints
+    lines: List[str] = []
+    
     # Countries with highest GDP per capita
-    print("\n=== Top Countries by GDP per Capita ===")
-    countries_by_gdp = sorted(
+    lines += ["", "=== Top Countries by GDP per Capita ==="]
+    countries_by_gdp = heapq.nlargest(
+        top_n,
         [c for c in data.values() if c.gdp_per_capita is not None],
-        key=lambda x: x.gdp_per_capita or 0,
-        reverse=True,
+        key=attrgetter("gdp_per_capita"),
     )
     
-    for i, country in enumerate(countries_by_gdp[:top_n], 1):
-        if country.gdp_per_capita is not None:
-            print(f"{i}. {country.country}: ${country.gdp_per_capita:,.2f}")
+    for i, country in enumerate(countries_by_gdp, 1):
+        lines.append(f"{i}. {country.country}: ${country.gdp_per_capita:,.2f}")
     
     # Countries with highest growth rate
-    print("\n=== Top Countries by GDP Growth Rate ===")
-    countries_by_growth = sorted(
+    lines += ["", "=== Top Countries by GDP Growth Rate ==="]
+    countries_by_growth = heapq.nlargest(
+        top_n,
         [c for c in data.values() if c.gdp_growth_rate is not None],
-        key=lambda x: x.gdp_growth_rate or 0,
-        reverse=True,
+        key=attrgetter("gdp_growth_rate"),
     )
     
-    for i, country in enumerate(countries_by_growth[:top_n], 1):
-        if country.gdp_growth_rate is not None:
-            print(f"{i}. {country.country}: {country.gdp_growth_rate:.2f}%")
+    for i, country in enumerate(countries_by_growth, 1):
+        lines.append(f"{i}. {country.country}: {country.gdp_growth_rate:.2f}%")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-async def main() -> int:
+async def main(args: Optional[argparse.Namespace] = None) -> int:
     """Main entry point for the CLI.
     
+    Args:
+        args: Already-parsed arguments; parsed from sys.argv if omitted
+    
     Returns:
         Exit code (0 for success, non-zero for errors)
     """
-    args = parse_args()
-    setup_logging(args.verbose)
+    if args is None:
+        args = parse_args()
+        setup_logging(args.verbose)
     
     try:
         logger.info("Starting Wikipedia GDP crawler")
         crawler = WikipediaGDPCrawler()
-        data = await crawler.crawl()
+        try:
+            data = await crawler.crawl()
+        finally:
+            await crawler.aclose()
         
         output_path = Path(args.output)
         
         # Create directory if it doesn't exist
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        if args.pretty:
-            # Convert to Python dict first for pretty printing
-            data_dict = msgspec.json.decode(msgspec.json.encode(data))
-            with open(output_path, "w") as f:
-                json.dump(data_dict, f, indent=2, default=str)
-        else:
-            crawler.save_to_json(data, str(output_path))
+        crawler.save_to_json(data, str(output_path), pretty=args.pretty)
         
         logger.info(f"Data saved to {output_path}")
         
@@ -152,7 +155,10 @@ async def main() -> int:
 
 def run() -> None:
     """Entry point for the CLI script."""
-    sys.exit(asyncio.run(main()))
+    # Parse before starting the event loop so --help and usage errors exit cheaply
+    args = parse_args()
+    setup_logging(args.verbose)
+    sys.exit(asyncio.run(main(args)))
 
 
 if __name__ == "__main__":
@@ -2,6 +2,10 @@
 
 import asyncio
 import logging
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
 from typing import Dict, Optional
 
 import httpx
@@ -12,6 +16,9 @@ from src.parser import WikipediaParser
 
 logger = logging.getLogger(__name__)
 
+# Status codes that usually clear up on their own and are worth retrying
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+
 
 class WikipediaGDPCrawler:
     """Crawler for extracting GDP data from Wikipedia."""
@@ -27,8 +34,41 @@ class WikipediaGDPCrawler:
             "AppleWebKit/537.36 (KHTML, like Gecko) "
             "Chrome/91.0.4472.114 Safari/537.36"
         )
+        self.max_attempts = 4  # Total tries per page: the first plus up to 3 retries
+        self.backoff_base = 0.5  # First retry delay in seconds, doubled each time
+        self.backoff_cap = 8.0  # Upper bound on our own exponential backoff
+        self.max_retry_after = 60.0  # Longest server-requested wait we will honor
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use.
+        
+        Returns:
+            httpx AsyncClient reused across crawls so connections stay alive
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers={"User-Agent": self.user_agent},
+                timeout=httpx.Timeout(self.timeout),
+                limits=httpx.Limits(
+                    max_connections=10,
+                    max_keepalive_connections=10,
+                    keepalive_expiry=300.0,
+                ),
+                # Both pages live on en.wikipedia.org, so HTTP/2 multiplexes
+                # the concurrent fetches over a single connection
+                http2=True,
+                follow_redirects=True,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client, if one was created."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
-    async def fetch_page(self, url: str, client: httpx.AsyncClient) -> Optional[str]:
+    async def fetch_page(self, url: str, client: httpx.AsyncClient) -> Optional[bytes]:
         """Fetch a Wikipedia page.
         
         Args:
@@ -36,22 +76,90 @@ class WikipediaGDPCrawler:
             client: httpx AsyncClient instance
             
         Returns:
-            HTML content of the page or None if an error occurred
+            Raw HTML bytes of the page or None if an error occurred
+        """
+        for attempt in range(1, self.max_attempts + 1):
+            retry_after: Optional[str] = None
+            try:
+                response = await client.get(url)
+                response.raise_for_status()
+                # Hand the undecoded body to the parser to skip a str round trip
+                return response.content
+            except httpx.HTTPStatusError as e:
+                status_code = e.response.status_code
+                if status_code not in RETRYABLE_STATUS_CODES or attempt == self.max_attempts:
+                    logger.error(f"Error fetching {url}: {e}")
+                    return None
+                if status_code == 429:
+                    retry_after = e.response.headers.get("retry-after")
+                logger.warning(f"Retrying {url} after HTTP {status_code} (attempt {attempt})")
+            except httpx.TransportError as e:
+                if attempt == self.max_attempts:
+                    logger.error(f"Error fetching {url}: {e}")
+                    return None
+                logger.warning(f"Retrying {url} after {e!r} (attempt {attempt})")
+            except httpx.HTTPError as e:
+                logger.error(f"Error fetching {url}: {e}")
+                return None
+            except Exception as e:
+                logger.error(f"Unexpected error fetching {url}: {e}")
+                return None
+            
+            delay = self._retry_delay(attempt, retry_after)
+            if delay is None:
+                logger.error(
+                    f"Giving up on {url}: Retry-After of {retry_after!r} exceeds "
+                    f"{self.max_retry_after}s"
+                )
+                return None
+            await asyncio.sleep(delay)
+        
+        return None
+
+    def _retry_delay(self, attempt: int, retry_after: Optional[str] = None) -> Optional[float]:
+        """Compute how long to wait before the next attempt.
+        
+        Args:
+            attempt: Number of the attempt that just failed, starting at 1
+            retry_after: Value of the server's Retry-After header, if any
+            
+        Returns:
+            Delay in seconds, or None if the server asked for a longer wait
+            than ``max_retry_after``
+        """
+        if retry_after is not None:
+            seconds = self._parse_retry_after(retry_after)
+            if seconds is not None:
+                # Retrying before the server's deadline would only be throttled again
+                return seconds if seconds <= self.max_retry_after else None
+        
+        delay = self.backoff_base * 2.0 ** (attempt - 1) + random.uniform(0, self.backoff_base)
+        return min(delay, self.backoff_cap)
+
+    @staticmethod
+    def _parse_retry_after(value: str) -> Optional[float]:
+        """Convert a Retry-After header to seconds from now.
+        
+        Args:
+            value: Header value, either delay-seconds or an HTTP-date
+            
+        Returns:
+            Non-negative delay in seconds, or None if the value is malformed
         """
         try:
-            response = await client.get(
-                url,
-                follow_redirects=True,
-                timeout=self.timeout,
-            )
-            response.raise_for_status()
-            return response.text
-        except httpx.HTTPError as e:
-            logger.error(f"Error fetching {url}: {e}")
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
             return None
-        except Exception as e:
-            logger.error(f"Unexpected error fetching {url}: {e}")
+        if when is None:  # Python < 3.10 returns None instead of raising
             return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
 
     async def crawl(self) -> WikipediaGDPData:
         """Crawl Wikipedia to extract GDP data.
@@ -59,57 +167,63 @@ class WikipediaGDPCrawler:
         Returns:
             WikipediaGDPData object containing the extracted data
         """
-        headers = {"User-Agent": self.user_agent}
+        client = await self._get_client()
+
+        # Fetch both pages concurrently
+        per_capita_html, growth_rate_html = await asyncio.gather(
+            self.fetch_page(self.gdp_per_capita_url, client),
+            self.fetch_page(self.gdp_growth_rate_url, client),
+        )
         
-        async with httpx.AsyncClient(headers=headers) as client:
-            # Fetch both pages concurrently
-            per_capita_html, growth_rate_html = await asyncio.gather(
-                self.fetch_page(self.gdp_per_capita_url, client),
-                self.fetch_page(self.gdp_growth_rate_url, client),
-            )
-            
-            # Parse the data
-            per_capita_data = []
-            growth_rate_data = []
-            
-            if per_capita_html:
-                per_capita_data = self.parser.parse_gdp_per_capita(per_capita_html)
-                logger.info(f"Extracted {len(per_capita_data)} GDP per capita entries")
-            else:
-                logger.warning("Failed to fetch GDP per capita data")
-            
-            if growth_rate_html:
-                growth_rate_data = self.parser.parse_gdp_growth_rate(growth_rate_html)
-                logger.info(f"Extracted {len(growth_rate_data)} GDP growth rate entries")
-            else:
-                logger.warning("Failed to fetch GDP growth rate data")
-            
-            # Create the result object
-            result = WikipediaGDPData(
-                per_capita=per_capita_data,
-                growth_rates=growth_rate_data,
-            )
-            
-            # Combine the data
-            result.combine_data()
-            
-            return result
+        # Parse the data
+        per_capita_data = []
+        growth_rate_data = []
+        
+        if per_capita_html:
+            per_capita_data = self.parser.parse_gdp_per_capita(per_capita_html)
+            logger.info(f"Extracted {len(per_capita_data)} GDP per capita entries")
+        else:
+            logger.warning("Failed to fetch GDP per capita data")
+        
+        if growth_rate_html:
+            growth_rate_data = self.parser.parse_gdp_growth_rate(growth_rate_html)
+            logger.info(f"Extracted {len(growth_rate_data)} GDP growth rate entries")
+        else:
+            logger.warning("Failed to fetch GDP growth rate data")
+        
+        # Create the result object
+        result = WikipediaGDPData(
+            per_capita=per_capita_data,
+            growth_rates=growth_rate_data,
+        )
+        
+        # Combine the data
+        result.combine_data()
+        
+        return result
 
-    def save_to_json(self, data: WikipediaGDPData, filename: str = "gdp_data.json") -> None:
+    def save_to_json(
+        self,
+        data: WikipediaGDPData,
+        filename: str = "gdp_data.json",
+        pretty: bool = False,
+    ) -> None:
         """Save the GDP data to a JSON file.
         
+        Errors propagate unlogged so the caller can report them once.
+        
         Args:
             data: WikipediaGDPData object
             filename: Path to save the JSON file
+            pretty: Whether to indent the output (readable but larger)
         """
-        try:
-            # Use msgspec for high-performance JSON encoding
-            json_bytes = msgspec.json.encode(data)
-            with open(filename, "wb") as f:
-                f.write(json_bytes)
-            logger.info(f"Saved GDP data to {filename}")
-        except Exception as e:
-            logger.error(f"Error saving data to {filename}: {e}")
+        # Use msgspec for high-performance JSON encoding
+        json_bytes = msgspec.json.encode(data)
+        if pretty:
+            # Re-indent the encoded bytes instead of round-tripping through dicts
+            json_bytes = msgspec.json.format(json_bytes, indent=2)
+        Path(filename).write_bytes(json_bytes)
+        logger.info(f"Saved GDP data to {filename}")
 
 
 async def main() -> None:
@@ -120,7 +234,10 @@ async def main() -> None:
     )
     
     crawler = WikipediaGDPCrawler()
-    data = await crawler.crawl()
+    try:
+        data = await crawler.crawl()
+    finally:
+        await crawler.aclose()
     
     logger.info(f"Found {len(data.per_capita)} GDP per capita entries")
     logger.info(f"Found {len(data.growth_rates)} GDP growth rate entries")
@@ -6,7 +6,7 @@ from typing import Dict, List, Optional, Union
 import msgspec
 
 
-class GDPPerCapita(msgspec.Struct):
+class GDPPerCapita(msgspec.Struct, gc=False, frozen=True):
     """Model for GDP per capita data."""
 
     country: str
@@ -17,7 +17,7 @@ class GDPPerCapita(msgspec.Struct):
     note: Optional[str] = None
 
 
-class GDPGrowthRate(msgspec.Struct):
+class GDPGrowthRate(msgspec.Struct, gc=False, frozen=True):
     """Model for GDP growth rate data."""
 
     country: str
@@ -28,7 +28,7 @@ class GDPGrowthRate(msgspec.Struct):
     note: Optional[str] = None
 
 
-class CountryStats(msgspec.Struct):
+class CountryStats(msgspec.Struct, gc=False, frozen=True):
     """Combined GDP statistics for a country."""
 
     country: str
@@ -49,18 +49,25 @@ class WikipediaGDPData(msgspec.Struct):
 
     def combine_data(self) -> None:
         """Combine per-capita and growth rate data into unified country stats."""
-        countries: Dict[str, CountryStats] = {}
+        # Index each source by country; later duplicates win, as before
+        per_capita = {entry.country: entry for entry in self.per_capita}
+        growth_rates = {entry.country: entry for entry in self.growth_rates}
         
-        for entry in self.per_capita:
-            if entry.country not in countries:
-                countries[entry.country] = CountryStats(country=entry.country)
-            countries[entry.country].gdp_per_capita = entry.gdp_per_capita
-            countries[entry.country].gdp_per_capita_rank = entry.rank
+        # Every country gets the same date, so look it up once
+        today = date.today()
         
-        for entry in self.growth_rates:
-            if entry.country not in countries:
-                countries[entry.country] = CountryStats(country=entry.country)
-            countries[entry.country].gdp_growth_rate = entry.growth_rate_percent
-            countries[entry.country].gdp_growth_rate_rank = entry.rank
+        # Build each country's stats in one go, per-capita countries first
+        countries: Dict[str, CountryStats] = {}
+        for country in {**per_capita, **growth_rates}:
+            pc = per_capita.get(country)
+            gr = growth_rates.get(country)
+            countries[country] = CountryStats(
+                country=country,
+                gdp_per_capita=pc.gdp_per_capita if pc is not None else None,
+                gdp_per_capita_rank=pc.rank if pc is not None else None,
+                gdp_growth_rate=gr.growth_rate_percent if gr is not None else None,
+                gdp_growth_rate_rank=gr.rank if gr is not None else None,
+                last_updated=today,
+            )
         
         self.combined_data = countries 
\ No newline at end of file
@@ -1,15 +1,34 @@
 """Module for parsing Wikipedia HTML pages to extract GDP data."""
 
+import math
 import re
 import logging
-from typing import List, Optional, Tuple
-from bs4 import BeautifulSoup
+from typing import List, Optional, Tuple, Union
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 
 from .models import GDPGrowthRate, GDPPerCapita
 
 
 logger = logging.getLogger(__name__)
 
+# Patterns used on every table cell, compiled once at import
+_FOOTNOTE_RE = re.compile(r'\[[^\]]*\]')
+_TAG_RE = re.compile(r'<[^>]+>')
+_NON_NUM_RE = re.compile(r'[^\d.\-+]')
+_YEAR_RE = re.compile(r'(\d{4})')
+_INT_RE = re.compile(r'^\d+$')
+
+# Separators and units stripped from numeric cells in a single C-level pass;
+# Wikipedia writes negative numbers with a Unicode minus sign
+_NUM_TRANS = str.maketrans({
+    ',': None,
+    '%': None,
+    '$': None,
+    ' ': None,
+    '\u00a0': None,
+    '\u2212': '-',
+})
+
 
 class WikipediaParser:
     """Parser for extracting GDP data from Wikipedia pages."""
@@ -20,107 +39,124 @@ class WikipediaParser:
 
     def _clean_country_name(self, name: str) -> str:
         """Clean a country name by removing footnotes and extra spaces."""
-        # Remove footnotes like [a] or [1]
-        name = re.sub(r'\[\w+\]', '', name)
-        # Remove any HTML tags
-        name = re.sub(r'<[^>]+>', '', name)
-        # Clean up extra whitespace
-        name = re.sub(r'\s+', ' ', name).strip()
-        return name
+        # Remove footnotes like [a], [1] or [n 1]; most cells have none
+        if '[' in name:
+            name = _FOOTNOTE_RE.sub('', name)
+        # Remove any HTML tags (cell text from the parser is already tag-free)
+        if '<' in name:
+            name = _TAG_RE.sub('', name)
+        # Collapse and strip whitespace in a single C-level split
+        return ' '.join(name.split())
 
     def _parse_float(self, value: str) -> float:
         """Parse a string into a float, handling common formatting."""
-        # Remove commas, percentage signs, and other non-numeric characters
-        cleaned_value = re.sub(r'[^\d.\-+]', '', value)
+        # Fast path: drop separators and units, which covers most cells
+        cleaned_value = value.translate(_NUM_TRANS)
+        try:
+            result = float(cleaned_value)
+        except ValueError:
+            pass
+        else:
+            # float() also accepts "nan" and "inf", which are not GDP figures
+            if math.isfinite(result):
+                return result
+        
+        # Remove footnotes and any other non-numeric characters
+        if '[' in cleaned_value:
+            cleaned_value = _FOOTNOTE_RE.sub('', cleaned_value)
+        cleaned_value = _NON_NUM_RE.sub('', cleaned_value)
         try:
             return float(cleaned_value)
         except ValueError:
             logger.warning(f"Failed to parse float from: '{value}', cleaned to: '{cleaned_value}'")
             return 0.0
 
-    def _extract_year_from_html(self, html: str) -> int:
-        """Extract the year from the HTML content."""
-        soup = BeautifulSoup(html, 'html.parser')
-        
+    def _row_cells(self, row: LexborNode) -> List[LexborNode]:
+        """Return the cells of a table row without a recursive descendant scan."""
+        # Cells are always direct children of <tr>
+        return [cell for cell in row.iter() if cell.tag in ('td', 'th')]
+
+    def _extract_year_from_tree(self, tree: LexborHTMLParser) -> int:
+        """Extract the year from an already-parsed HTML tree."""
         # Look for year patterns in the table headers or title
-        year_text = soup.find('title')
+        year_text = tree.css_first('title')
         if year_text:
-            logger.info(f"Title text: {year_text.text}")
-            year_match = re.search(r'(\d{4})', year_text.text)
+            title = year_text.text()
+            logger.info(f"Title text: {title}")
+            year_match = _YEAR_RE.search(title)
             if year_match:
                 return int(year_match.group(1))
                 
-        # Try to find year in the main content or headings
-        headings = soup.find_all(['h1', 'h2', 'h3'])
+        # Try the headings, restricted to the article body when present
+        content = tree.css_first('#mw-content-text')
+        headings = (content or tree).css('h1, h2, h3')
         for heading in headings:
-            year_match = re.search(r'(\d{4})', heading.text)
+            year_match = _YEAR_RE.search(heading.text())
             if year_match:
                 return int(year_match.group(1))
                 
         return self.current_year
 
-    def parse_gdp_per_capita(self, html: str) -> List[GDPPerCapita]:
+    def parse_gdp_per_capita(self, html: Union[str, bytes]) -> List[GDPPerCapita]:
         """Parse GDP per capita data from Wikipedia HTML."""
         results: List[GDPPerCapita] = []
         
-        soup = BeautifulSoup(html, 'html.parser')
+        tree = LexborHTMLParser(html)
         
-        # Extract the year from the HTML content
-        year = self._extract_year_from_html(html)
+        # Extract the year from the parsed tree
+        year = self._extract_year_from_tree(tree)
         logger.info(f"Extracted year: {year}")
         
-        # Find all tables
-        tables = soup.find_all('table')
-        logger.info(f"Found {len(tables)} tables total")
+        # Only wikitables hold the ranked data
+        tables = tree.css('table.wikitable')
+        logger.info(f"Found {len(tables)} wikitables")
         
-        # Find wikitables specifically
-        wikitables = soup.find_all('table', class_='wikitable')
-        logger.info(f"Found {len(wikitables)} wikitables")
-        
-        # Check both regular tables and wikitables
-        for i, table in enumerate(tables):
-            header_row = table.find('tr')
+        for table in tables:
+            header_row = table.css_first('tr')
             if not header_row:
                 continue
                 
-            headers = [th.get_text(strip=True) for th in header_row.find_all(['th', 'td'])]
-            logger.info(f"Table {i+1} headers: {headers}")
+            headers = [th.text(strip=True) for th in self._row_cells(header_row)]
             
             # Focus on tables with country/territory column
             if any('country' in header.lower() for header in headers):
                 logger.info(f"Found potential GDP table with headers: {headers}")
                 
                 # Process each data row
-                rows = table.find_all('tr')[1:]  # Skip header row
+                rows = table.css('tr')[1:]  # Skip header row
                 logger.info(f"Found {len(rows)} data rows")
                 
+                # Find the country index (usually first or second column)
+                country_index = next((i for i, h in enumerate(headers) if 'country' in h.lower()), 0)
+                
                 for row in rows:
-                    cells = row.find_all(['td', 'th'])
+                    cells = self._row_cells(row)
                     
                     if len(cells) < 2:
                         continue
                         
                     try:
                         # Assuming first column is country/territory and second column is GDP value
-                        # Find the country index (usually first or second column)
-                        country_index = next((i for i, h in enumerate(headers) if 'country' in h.lower()), 0)
                         country_element = cells[country_index] if country_index < len(cells) else cells[0]
-                        country = self._clean_country_name(country_element.get_text(strip=True))
+                        country = self._clean_country_name(country_element.text(strip=True))
                         
                         # Find GDP value (often in columns following country)
                         gdp_index = 1 if country_index == 0 else 2
                         rank = 0
                         
                         # If the first column is a number, it's likely the rank
-                        if country_index > 0 and re.match(r'^\d+$', cells[0].get_text(strip=True)):
-                            rank = int(cells[0].get_text(strip=True))
+                        if country_index > 0:
+                            rank_text = cells[0].text(strip=True)
+                            if _INT_RE.match(rank_text):
+                                rank = int(rank_text)
                         
                         # Try to get GDP value
                         if gdp_index < len(cells):
-                            gdp_text = cells[gdp_index].get_text(strip=True)
+                            gdp_text = cells[gdp_index].text(strip=True)
                             gdp_value = self._parse_float(gdp_text)
                             
-                            logger.info(f"Found entry: {country}, rank: {rank}, GDP: {gdp_value}")
+                            if logger.isEnabledFor(logging.DEBUG):
+                                logger.debug(f"Found entry: {country}, rank: {rank}, GDP: {gdp_value}")
                             
                             if country and gdp_value > 0:
                                 results.append(
@@ -141,80 +177,65 @@ class WikipediaParser:
         
         return results
 
-    def parse_gdp_growth_rate(self, html: str) -> List[GDPGrowthRate]:
+    def parse_gdp_growth_rate(self, html: Union[str, bytes]) -> List[GDPGrowthRate]:
         """Parse GDP growth rate data from Wikipedia HTML."""
         results: List[GDPGrowthRate] = []
         
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        # Log page title
-        title = soup.find('title')
-        logger.info(f"Growth rate page title: {title.text if title else 'No title found'}")
-        
-        # Extract year information
-        year = self.current_year
-        year_elements = soup.find_all(string=re.compile(r'\d{4}'))
-        for elem in year_elements:
-            if 'GDP' in elem or 'growth' in elem.lower():
-                year_match = re.search(r'(\d{4})', elem)
-                if year_match:
-                    year = int(year_match.group(1))
-                    logger.info(f"Found growth rate year: {year}")
-                    break
+        tree = LexborHTMLParser(html)
         
+        # Extract year information from the title or article headings
+        year = self._extract_year_from_tree(tree)
         logger.info(f"Using growth rate year: {year}")
         
-        # Find all tables
-        tables = soup.find_all('table')
-        logger.info(f"Found {len(tables)} tables total in growth rate page")
-        
-        # Find wikitables specifically
-        wikitables = soup.find_all('table', class_='wikitable')
-        logger.info(f"Found {len(wikitables)} wikitables in growth rate page")
+        # Only wikitables hold the ranked data
+        tables = tree.css('table.wikitable')
+        logger.info(f"Found {len(tables)} wikitables in growth rate page")
         
-        # Check both regular tables and wikitables
-        for i, table in enumerate(tables):
-            header_row = table.find('tr')
+        for table in tables:
+            header_row = table.css_first('tr')
             if not header_row:
                 continue
                 
-            headers = [th.get_text(strip=True) for th in header_row.find_all(['th', 'td'])]
-            logger.info(f"Growth rate table {i+1} headers: {headers}")
+            headers = [th.text(strip=True) for th in self._row_cells(header_row)]
             
             # Focus on tables with country column and growth/rate terminology
             if any('country' in header.lower() for header in headers):
                 logger.info(f"Found potential growth rate table with headers: {headers}")
                 
                 # Process each data row
-                rows = table.find_all('tr')[1:]  # Skip header row
+                rows = table.css('tr')[1:]  # Skip header row
                 logger.info(f"Found {len(rows)} growth rate data rows")
                 
+                # Find the country index
+                country_index = next((i for i, h in enumerate(headers) if 'country' in h.lower()), 1)
+                
                 for row in rows:
-                    cells = row.find_all(['td', 'th'])
+                    cells = self._row_cells(row)
                     
                     if len(cells) < 2:
                         continue
                         
                     try:
                         # Assuming first column is rank, second is country/territory, third is growth rate
-                        # Find the country index
-                        country_index = next((i for i, h in enumerate(headers) if 'country' in h.lower()), 1)
                         country_element = cells[country_index] if country_index < len(cells) else cells[1]
-                        country = self._clean_country_name(country_element.get_text(strip=True))
+                        country = self._clean_country_name(country_element.text(strip=True))
                         
                         # Find rank (often the first column)
                         rank = 0
                         rank_index = 0
-                        if rank_index < len(cells) and re.match(r'^\d+$', cells[rank_index].get_text(strip=True)):
-                            rank = int(cells[rank_index].get_text(strip=True))
+                        if rank_index < len(cells):
+                            rank_text = cells[rank_index].text(strip=True)
+                            if _INT_RE.match(rank_text):
+                                rank = int(rank_text)
                         
                         # Find growth rate (often third column)
                         growth_index = country_index + 1
                         if growth_index < len(cells):
-                            growth_text = cells[growth_index].get_text(strip=True)
+                            growth_text = cells[growth_index].text(strip=True)
                             growth_rate = self._parse_float(growth_text)
                             
-                            logger.info(f"Found growth entry: {country}, rank: {rank}, growth: {growth_rate}")
+                            if logger.isEnabledFor(logging.DEBUG):
+                                logger.debug(f"Found growth entry: {country}, rank: {rank}, growth: {growth_rate}")
                             
                             if country:
                                 results.append(
@@ -1,18 +1,34 @@
 """Tests for the command-line interface."""
 
 import argparse
-import io
-import sys
+import asyncio
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import msgspec
 import pytest
 
-from src.cli import main, parse_args, print_summary, setup_logging
+from src.cli import main, parse_args, print_summary, run, setup_logging
 from src.crawler import WikipediaGDPCrawler
 from src.models import CountryStats, GDPGrowthRate, GDPPerCapita, WikipediaGDPData
 
 
+@pytest.fixture
+def mock_crawler() -> AsyncMock:
+    """Create a mock crawler whose sync methods stay synchronous."""
+    return AsyncMock(spec=WikipediaGDPCrawler)
+
+
+def test_spec_enforcement(mock_crawler: AsyncMock) -> None:
+    """Test that the spec'd crawler mock matches the real crawler's API."""
+    # Unknown attributes are rejected
+    with pytest.raises(AttributeError):
+        mock_crawler.not_a_crawler_method
+    
+    # Sync methods stay sync, so main() can call save_to_json without awaiting
+    assert not asyncio.iscoroutine(mock_crawler.save_to_json(MagicMock(), "out.json"))
+
+
 def test_setup_logging() -> None:
     """Test the setup_logging function."""
     # Test with verbose=False (default)
@@ -58,7 +74,7 @@ def test_parse_args() -> None:
         assert args.top == 5
 
 
-def test_print_summary() -> None:
+def test_print_summary(capsys: pytest.CaptureFixture[str]) -> None:
     """Test the summary printing function."""
     # Create test data
     country_data = {
@@ -85,44 +101,73 @@ def test_print_summary() -> None:
         )
     }
     
-    # Capture stdout
-    original_stdout = sys.stdout
-    captured_output = io.StringIO()
-    sys.stdout = captured_output
+    print_summary(country_data, top_n=2)
+    output = capsys.readouterr().out
     
-    try:
-        print_summary(country_data, top_n=2)
-        output = captured_output.getvalue()
-        
-        # Check that we see the expected sections
-        assert "Top Countries by GDP per Capita" in output
-        assert "Top Countries by GDP Growth Rate" in output
-        
-        # Check that we see the right countries in the right order
-        assert "1. Country A: $50,000.00" in output
-        assert "2. Country B: $40,000.00" in output
-        assert "Country C" not in output  # Should be cut off by top_n=2
-        
-        assert "1. Country C: 4.50%" in output
-        assert "2. Country B: 3.50%" in output
-        assert "Country A: 2.50%" not in output  # Should be cut off by top_n=2
-    finally:
-        sys.stdout = original_stdout
+    # Check that we see the expected sections
+    assert "Top Countries by GDP per Capita" in output
+    assert "Top Countries by GDP Growth Rate" in output
+    gdp_section, growth_section = output.split("Top Countries by GDP Growth Rate")
+    
+    # Check that we see the right countries in the right order
+    assert "1. Country A: $50,000.00" in gdp_section
+    assert "2. Country B: $40,000.00" in gdp_section
+    assert "Country C" not in gdp_section  # Should be cut off by top_n=2
+    
+    assert "1. Country C: 4.50%" in growth_section
+    assert "2. Country B: 3.50%" in growth_section
+    assert "Country A" not in growth_section  # Should be cut off by top_n=2
 
 
-@pytest.mark.asyncio
-async def test_main_success() -> None:
-    """Test the main function with successful execution."""
-    # Create mock objects
-    mock_args = MagicMock()
-    mock_args.output = "test_output.json"
-    mock_args.verbose = False
-    mock_args.pretty = False
-    mock_args.summary = False
+def test_print_summary_skips_missing_values(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test that countries without a value are left out of that ranking."""
+    country_data = {
+        "Country A": CountryStats(country="Country A", gdp_per_capita=50000.0),
+        "Country B": CountryStats(country="Country B", gdp_growth_rate=3.5),
+    }
     
-    mock_crawler = AsyncMock(spec=WikipediaGDPCrawler)
+    # top_n larger than the number of ranked countries
+    print_summary(country_data, top_n=10)
+    output = capsys.readouterr().out
+    gdp_section, growth_section = output.split("Top Countries by GDP Growth Rate")
     
-    # Create test data
+    assert "1. Country A: $50,000.00" in gdp_section
+    assert "Country B" not in gdp_section
+    assert "1. Country B: 3.50%" in growth_section
+    assert "Country A" not in growth_section
+
+
+def test_run_help_skips_event_loop(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test that --help exits before an event loop is started."""
+    with patch("sys.argv", ["wiki-gdp", "--help"]), \
+         patch("src.cli.asyncio.run") as mock_asyncio_run:
+        with pytest.raises(SystemExit) as exc_info:
+            run()
+    
+    assert exc_info.value.code == 0
+    assert "usage:" in capsys.readouterr().out
+    mock_asyncio_run.assert_not_called()
+
+
+def test_run_passes_parsed_args() -> None:
+    """Test that run() parses arguments once and hands them to main()."""
+    with patch("sys.argv", ["wiki-gdp", "-v"]), \
+         patch("src.cli.setup_logging") as mock_setup_logging, \
+         patch("src.cli.main", new_callable=MagicMock) as mock_main, \
+         patch("src.cli.asyncio.run", return_value=0) as mock_asyncio_run:
+        with pytest.raises(SystemExit) as exc_info:
+            run()
+    
+    assert exc_info.value.code == 0
+    mock_setup_logging.assert_called_once_with(True)
+    args = mock_main.call_args.args[0]
+    assert args.verbose
+    mock_asyncio_run.assert_called_once_with(mock_main.return_value)
+
+
+@pytest.fixture(scope="module")
+def mock_data() -> WikipediaGDPData:
+    """Create the crawl result returned by the mocked crawler."""
     per_capita = [
         GDPPerCapita(country="Country A", rank=1, gdp_per_capita=50000.0, year=2023),
     ]
@@ -131,130 +176,135 @@ async def test_main_success() -> None:
         GDPGrowthRate(country="Country B", rank=1, growth_rate_percent=3.5, year=2023),
     ]
     
-    mock_data = WikipediaGDPData(per_capita=per_capita, growth_rates=growth_rates)
-    mock_crawler.crawl.return_value = mock_data
-    
-    with patch("src.cli.parse_args", return_value=mock_args), \
-         patch("src.cli.setup_logging") as mock_setup_logging, \
-         patch("src.cli.WikipediaGDPCrawler", return_value=mock_crawler), \
-         patch("pathlib.Path.mkdir"):
-        
-        # Run the main function
-        result = await main()
-        
-        # Check that setup_logging was called
-        mock_setup_logging.assert_called_once_with(False)
-        
-        # Check that crawler was initialized and crawl() was called
-        mock_crawler.crawl.assert_called_once()
-        
-        # Check that save_to_json was called
-        mock_crawler.save_to_json.assert_called_once()
-        
-        # Check exit code
-        assert result == 0
+    return WikipediaGDPData(per_capita=per_capita, growth_rates=growth_rates)
 
 
 @pytest.mark.asyncio
-async def test_main_with_pretty_json() -> None:
-    """Test the main function with pretty JSON option."""
+@pytest.mark.parametrize(
+    "pretty,summary",
+    [(False, False), (True, False), (False, True)],
+    ids=["plain", "pretty_json", "summary"],
+)
+async def test_main(
+    mock_crawler: AsyncMock,
+    mock_data: WikipediaGDPData,
+    pretty: bool,
+    summary: bool,
+) -> None:
+    """Test the main function's successful runs for each output option."""
     # Create mock objects
-    mock_args = MagicMock()
-    mock_args.output = "test_output.json"
-    mock_args.verbose = False
-    mock_args.pretty = True
-    mock_args.summary = False
-    
-    mock_crawler = AsyncMock(spec=WikipediaGDPCrawler)
-    
-    # Create test data
-    per_capita = [
-        GDPPerCapita(country="Country A", rank=1, gdp_per_capita=50000.0, year=2023),
-    ]
-    
-    growth_rates = [
-        GDPGrowthRate(country="Country B", rank=1, growth_rate_percent=3.5, year=2023),
-    ]
+    mock_args = argparse.Namespace(
+        output="test_output.json",
+        verbose=False,
+        pretty=pretty,
+        summary=summary,
+        top=10,
+    )
     
-    mock_data = WikipediaGDPData(per_capita=per_capita, growth_rates=growth_rates)
     mock_crawler.crawl.return_value = mock_data
     
     with patch("src.cli.parse_args", return_value=mock_args), \
-         patch("src.cli.setup_logging"), \
+         patch("src.cli.setup_logging") as mock_setup_logging, \
          patch("src.cli.WikipediaGDPCrawler", return_value=mock_crawler), \
          patch("pathlib.Path.mkdir"), \
-         patch("builtins.open", MagicMock()), \
-         patch("json.dump") as mock_json_dump:
+         patch("src.cli.print_summary") as mock_print_summary:
         
         # Run the main function
         result = await main()
-        
-        # Check that json.dump was called with indent parameter
-        mock_json_dump.assert_called_once()
-        args, kwargs = mock_json_dump.call_args
-        assert "indent" in kwargs
-        assert kwargs["indent"] == 2
-        
-        # Check exit code
-        assert result == 0
+    
+    # Check that setup_logging was called
+    mock_setup_logging.assert_called_once_with(False)
+    
+    # Check that crawler was initialized and crawl() was called
+    mock_crawler.crawl.assert_called_once()
+    
+    # Check that the data was saved in the requested format
+    mock_crawler.save_to_json.assert_called_once_with(
+        mock_data, "test_output.json", pretty=pretty
+    )
+    
+    # Check that the summary is only printed on request
+    if summary:
+        mock_print_summary.assert_called_once_with(mock_data.combined_data, 10)
+    else:
+        mock_print_summary.assert_not_called()
+    
+    # Check exit code
+    assert result == 0
 
 
 @pytest.mark.asyncio
-async def test_main_with_summary() -> None:
-    """Test the main function with summary option."""
-    # Create mock objects
-    mock_args = MagicMock()
-    mock_args.output = "test_output.json"
-    mock_args.verbose = False
-    mock_args.pretty = False
-    mock_args.summary = True
-    mock_args.top = 10
+async def test_main_writes_pretty_json(
+    tmp_path: Path,
+    mock_data: WikipediaGDPData,
+) -> None:
+    """Test that main() writes readable JSON to a new output directory."""
+    output_path = tmp_path / "out" / "gdp.json"
+    mock_args = argparse.Namespace(
+        output=str(output_path),
+        verbose=False,
+        pretty=True,
+        summary=False,
+        top=10,
+    )
     
-    mock_crawler = AsyncMock(spec=WikipediaGDPCrawler)
+    # Use the real save path; only the network crawl is stubbed
+    crawler = WikipediaGDPCrawler()
+    crawler.crawl = AsyncMock(return_value=mock_data)  # type: ignore
     
-    # Create test data
-    per_capita = [
-        GDPPerCapita(country="Country A", rank=1, gdp_per_capita=50000.0, year=2023),
-    ]
+    with patch("src.cli.WikipediaGDPCrawler", return_value=crawler):
+        result = await main(mock_args)
     
-    growth_rates = [
-        GDPGrowthRate(country="Country B", rank=1, growth_rate_percent=3.5, year=2023),
-    ]
+    assert result == 0
+    content = output_path.read_bytes()
+    assert content.startswith(b'{\n  "per_capita": [')
+    assert msgspec.json.decode(content, type=WikipediaGDPData) == mock_data
+
+
+@pytest.mark.asyncio
+async def test_main_returns_error_when_write_fails(
+    tmp_path: Path,
+    mock_data: WikipediaGDPData,
+) -> None:
+    """Test that main() exits non-zero when the output file cannot be written."""
+    # A directory at the output path makes the write itself fail
+    output_path = tmp_path / "gdp.json"
+    output_path.mkdir()
+    mock_args = argparse.Namespace(
+        output=str(output_path),
+        verbose=False,
+        pretty=True,
+        summary=False,
+        top=10,
+    )
     
-    mock_data = WikipediaGDPData(per_capita=per_capita, growth_rates=growth_rates)
-    mock_crawler.crawl.return_value = mock_data
+    crawler = WikipediaGDPCrawler()
+    crawler.crawl = AsyncMock(return_value=mock_data)  # type: ignore
     
-    with patch("src.cli.parse_args", return_value=mock_args), \
-         patch("src.cli.setup_logging"), \
-         patch("src.cli.WikipediaGDPCrawler", return_value=mock_crawler), \
-         patch("pathlib.Path.mkdir"), \
-         patch("src.cli.print_summary") as mock_print_summary:
-        
-        # Run the main function
-        result = await main()
-        
-        # Check that print_summary was called
-        mock_print_summary.assert_called_once_with(mock_data.combined_data, 10)
-        
-        # Check exit code
-        assert result == 0
+    with patch("src.cli.WikipediaGDPCrawler", return_value=crawler):
+        result = await main(mock_args)
+    
+    assert result == 1
 
 
 @pytest.mark.asyncio
 async def test_main_with_error() -> None:
     """Test the main function with an error during execution."""
     # Create mock objects that will raise an exception
-    mock_args = MagicMock()
-    mock_crawler = AsyncMock(spec=WikipediaGDPCrawler)
+    mock_args = argparse.Namespace(
+        output="test_output.json",
+        verbose=False,
+        pretty=False,
+        summary=False,
+        top=10,
+    )
+    mock_crawler = AsyncMock()
     mock_crawler.crawl.side_effect = Exception("Test error")
     
     with patch("src.cli.parse_args", return_value=mock_args), \
          patch("src.cli.setup_logging"), \
          patch("src.cli.WikipediaGDPCrawler", return_value=mock_crawler), \
-         patch("logging.getLogger") as mock_get_logger:
-        
-        mock_logger = MagicMock()
-        mock_get_logger.return_value = mock_logger
+         patch("src.cli.logger") as mock_logger:
         
         # Run the main function
         result = await main()
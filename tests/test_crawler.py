@@ -1,10 +1,13 @@
 """Tests for the Wikipedia GDP crawler."""
 
 import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
 from typing import Dict, List
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
+import msgspec
 import pytest
 import pytest_asyncio
 
@@ -13,7 +16,7 @@ from src.models import GDPGrowthRate, GDPPerCapita, WikipediaGDPData
 from src.parser import WikipediaParser
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_html_per_capita() -> str:
     """Return sample HTML for GDP per capita."""
     return """
@@ -27,7 +30,7 @@ def sample_html_per_capita() -> str:
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_html_growth_rate() -> str:
     """Return sample HTML for GDP growth rate."""
     return """
@@ -41,10 +44,16 @@ def sample_html_growth_rate() -> str:
     """
 
 
+@pytest.fixture
+def mock_client() -> AsyncMock:
+    """Create a mock HTTP client for fetch_page tests."""
+    return AsyncMock(spec=httpx.AsyncClient)
+
+
 @pytest.fixture
 def mock_parser() -> MagicMock:
     """Create a mock parser with predefined return values."""
-    parser = MagicMock(spec=WikipediaParser)
+    parser = MagicMock()
     
     # Mock GDP per capita parsing
     parser.parse_gdp_per_capita.return_value = [
@@ -74,33 +83,45 @@ class TestWikipediaGDPCrawler:
         assert crawler.user_agent != ""
     
     @pytest.mark.asyncio
-    async def test_fetch_page_success(self) -> None:
+    async def test_get_client_is_shared(self) -> None:
+        """Test that the HTTP client is created once and reused until closed."""
+        crawler = WikipediaGDPCrawler()
+        
+        client = await crawler._get_client()
+        assert await crawler._get_client() is client
+        assert client.headers["User-Agent"] == crawler.user_agent
+        
+        # Closing drops the client so the next call builds a fresh one
+        await crawler.aclose()
+        assert client.is_closed
+        new_client = await crawler._get_client()
+        assert new_client is not client
+        await crawler.aclose()
+    
+    @pytest.mark.asyncio
+    async def test_fetch_page_success(self, mock_client: AsyncMock) -> None:
         """Test successful page fetching."""
         crawler = WikipediaGDPCrawler()
         
-        # Mock the HTTP client
-        mock_client = AsyncMock(spec=httpx.AsyncClient)
         mock_response = MagicMock()
-        mock_response.text = "Sample HTML content"
+        mock_response.content = b"Sample HTML content"
         mock_response.raise_for_status = MagicMock()
         mock_client.get.return_value = mock_response
         
         result = await crawler.fetch_page("https://example.com", mock_client)
         
         # Assert request was made properly
-        mock_client.get.assert_called_once()
+        mock_client.get.assert_called_once_with("https://example.com")
         mock_response.raise_for_status.assert_called_once()
         
         # Assert we got the expected content
-        assert result == "Sample HTML content"
+        assert result == b"Sample HTML content"
     
     @pytest.mark.asyncio
-    async def test_fetch_page_http_error(self) -> None:
+    async def test_fetch_page_http_error(self, mock_client: AsyncMock) -> None:
         """Test page fetching with HTTP error."""
         crawler = WikipediaGDPCrawler()
         
-        # Mock the HTTP client
-        mock_client = AsyncMock(spec=httpx.AsyncClient)
         mock_client.get.side_effect = httpx.HTTPError("HTTP Error")
         
         result = await crawler.fetch_page("https://example.com", mock_client)
@@ -112,12 +133,10 @@ class TestWikipediaGDPCrawler:
         assert result is None
     
     @pytest.mark.asyncio
-    async def test_fetch_page_general_error(self) -> None:
+    async def test_fetch_page_general_error(self, mock_client: AsyncMock) -> None:
         """Test page fetching with a general error."""
         crawler = WikipediaGDPCrawler()
         
-        # Mock the HTTP client
-        mock_client = AsyncMock(spec=httpx.AsyncClient)
         mock_client.get.side_effect = Exception("General Error")
         
         result = await crawler.fetch_page("https://example.com", mock_client)
@@ -128,17 +147,126 @@ class TestWikipediaGDPCrawler:
         # Assert we got None because of the error
         assert result is None
     
+    @pytest.mark.asyncio
+    async def test_fetch_page_retries_transient_status(self, mock_client: AsyncMock) -> None:
+        """Test that a retryable status is retried until the page loads."""
+        crawler = WikipediaGDPCrawler()
+        request = httpx.Request("GET", "https://example.com")
+        
+        mock_client.get.side_effect = [
+            httpx.Response(503, request=request),
+            httpx.Response(200, content=b"Sample HTML content", request=request),
+        ]
+        
+        with patch("src.crawler.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            result = await crawler.fetch_page("https://example.com", mock_client)
+        
+        assert result == b"Sample HTML content"
+        assert mock_client.get.call_count == 2
+        mock_sleep.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_fetch_page_honors_retry_after(self, mock_client: AsyncMock) -> None:
+        """Test that a 429 waits for the server's Retry-After delay."""
+        crawler = WikipediaGDPCrawler()
+        request = httpx.Request("GET", "https://example.com")
+        
+        mock_client.get.side_effect = [
+            httpx.Response(429, headers={"Retry-After": "2"}, request=request),
+            httpx.Response(200, content=b"Sample HTML content", request=request),
+        ]
+        
+        with patch("src.crawler.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            result = await crawler.fetch_page("https://example.com", mock_client)
+        
+        assert result == b"Sample HTML content"
+        mock_sleep.assert_awaited_once_with(2.0)
+    
+    @pytest.mark.asyncio
+    async def test_fetch_page_waits_past_backoff_cap(self, mock_client: AsyncMock) -> None:
+        """Test that a Retry-After above backoff_cap is still honored in full."""
+        crawler = WikipediaGDPCrawler()
+        request = httpx.Request("GET", "https://example.com")
+        
+        mock_client.get.side_effect = [
+            httpx.Response(429, headers={"Retry-After": "10"}, request=request),
+            httpx.Response(200, content=b"Sample HTML content", request=request),
+        ]
+        
+        with patch("src.crawler.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            result = await crawler.fetch_page("https://example.com", mock_client)
+        
+        assert result == b"Sample HTML content"
+        mock_sleep.assert_awaited_once_with(10.0)
+    
+    @pytest.mark.asyncio
+    async def test_fetch_page_gives_up_on_long_retry_after(self, mock_client: AsyncMock) -> None:
+        """Test that a Retry-After beyond max_retry_after is not retried early."""
+        crawler = WikipediaGDPCrawler()
+        request = httpx.Request("GET", "https://example.com")
+        
+        mock_client.get.return_value = httpx.Response(
+            429, headers={"Retry-After": "3600"}, request=request
+        )
+        
+        with patch("src.crawler.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            result = await crawler.fetch_page("https://example.com", mock_client)
+        
+        assert result is None
+        mock_client.get.assert_called_once()
+        mock_sleep.assert_not_awaited()
+    
+    def test_retry_delay_parses_http_date(self) -> None:
+        """Test that an HTTP-date Retry-After waits until that time."""
+        crawler = WikipediaGDPCrawler()
+        when = datetime.now(timezone.utc) + timedelta(seconds=30)
+        
+        delay = crawler._retry_delay(1, format_datetime(when, usegmt=True))
+        
+        assert delay is not None
+        assert 28.0 <= delay <= 30.0
+        assert crawler._retry_delay(1, "Thu, 01 Jan 1970 00:00:00 GMT") == 0.0
+    
+    @pytest.mark.asyncio
+    async def test_fetch_page_gives_up_after_max_attempts(self, mock_client: AsyncMock) -> None:
+        """Test that connection errors stop being retried after max_attempts."""
+        crawler = WikipediaGDPCrawler()
+        
+        mock_client.get.side_effect = httpx.ConnectError("Connection reset")
+        
+        with patch("src.crawler.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            result = await crawler.fetch_page("https://example.com", mock_client)
+        
+        assert result is None
+        assert mock_client.get.call_count == crawler.max_attempts
+        assert mock_sleep.await_count == crawler.max_attempts - 1
+    
+    @pytest.mark.asyncio
+    async def test_fetch_page_does_not_retry_client_error(self, mock_client: AsyncMock) -> None:
+        """Test that a non-retryable status fails immediately."""
+        crawler = WikipediaGDPCrawler()
+        request = httpx.Request("GET", "https://example.com")
+        
+        mock_client.get.return_value = httpx.Response(404, request=request)
+        
+        result = await crawler.fetch_page("https://example.com", mock_client)
+        
+        assert result is None
+        mock_client.get.assert_called_once()
+    
     @pytest.mark.asyncio
     async def test_crawl(
         self, 
+        mock_client: AsyncMock,
         mock_parser: MagicMock, 
         sample_html_per_capita: str, 
         sample_html_growth_rate: str
     ) -> None:
         """Test the crawl method with mocked responses."""
-        # Create crawler with mock parser
+        # Create crawler with mock parser and no real HTTP client
         crawler = WikipediaGDPCrawler()
         crawler.parser = mock_parser
+        crawler._get_client = AsyncMock(return_value=mock_client)  # type: ignore
         
         # Mock fetch_page method to return sample HTML
         async def mock_fetch_page(url: str, _: httpx.AsyncClient) -> str:
@@ -153,27 +281,58 @@ class TestWikipediaGDPCrawler:
         # Run the crawler
         result = await crawler.crawl()
         
-        # Check the result
-        assert isinstance(result, WikipediaGDPData)
-        assert len(result.per_capita) == 2
-        assert len(result.growth_rates) == 2
-        
         # Verify parser was called correctly
         mock_parser.parse_gdp_per_capita.assert_called_once_with(sample_html_per_capita)
         mock_parser.parse_gdp_growth_rate.assert_called_once_with(sample_html_growth_rate)
         
-        # Check combined data
-        assert "Luxembourg" in result.combined_data
-        assert "Ireland" in result.combined_data
-        assert "Guyana" in result.combined_data
-        assert "Libya" in result.combined_data
+        # Check the result and combined data
+        assert result.per_capita == mock_parser.parse_gdp_per_capita.return_value
+        assert result.growth_rates == mock_parser.parse_gdp_growth_rate.return_value
+        assert set(result.combined_data) == {"Luxembourg", "Ireland", "Guyana", "Libya"}
     
     @pytest.mark.asyncio
-    async def test_crawl_with_fetch_error(self, mock_parser: MagicMock) -> None:
+    async def test_crawl_fetches_concurrently(
+        self,
+        mock_client: AsyncMock,
+        mock_parser: MagicMock,
+    ) -> None:
+        """Test that both pages are in flight at once on the shared client."""
+        crawler = WikipediaGDPCrawler()
+        crawler.parser = mock_parser
+        crawler._get_client = AsyncMock(return_value=mock_client)  # type: ignore
+        
+        started: List[str] = []
+        clients: List[httpx.AsyncClient] = []
+        both_started = asyncio.Event()
+        
+        # Each fetch waits until the other has started, so a sequential crawl
+        # would never finish
+        async def mock_fetch_page(url: str, client: httpx.AsyncClient) -> bytes:
+            started.append(url)
+            clients.append(client)
+            if len(started) == 2:
+                both_started.set()
+            await both_started.wait()
+            return b"<html></html>"
+        
+        crawler.fetch_page = mock_fetch_page  # type: ignore
+        
+        await asyncio.wait_for(crawler.crawl(), timeout=1)
+        
+        assert set(started) == {crawler.gdp_per_capita_url, crawler.gdp_growth_rate_url}
+        assert clients == [mock_client, mock_client]
+    
+    @pytest.mark.asyncio
+    async def test_crawl_with_fetch_error(
+        self,
+        mock_client: AsyncMock,
+        mock_parser: MagicMock,
+    ) -> None:
         """Test crawl method when fetch_page returns None."""
-        # Create crawler with mock parser
+        # Create crawler with mock parser and no real HTTP client
         crawler = WikipediaGDPCrawler()
         crawler.parser = mock_parser
+        crawler._get_client = AsyncMock(return_value=mock_client)  # type: ignore
         
         # Mock fetch_page to return None (error case)
         async def mock_fetch_page_error(url: str, _: httpx.AsyncClient) -> None:
@@ -185,9 +344,8 @@ class TestWikipediaGDPCrawler:
         result = await crawler.crawl()
         
         # Check the result
-        assert isinstance(result, WikipediaGDPData)
-        assert len(result.per_capita) == 0
-        assert len(result.growth_rates) == 0
+        assert result.per_capita == []
+        assert result.growth_rates == []
         
         # Verify parser was not called
         mock_parser.parse_gdp_per_capita.assert_not_called()
@@ -214,6 +372,35 @@ class TestWikipediaGDPCrawler:
         temp_file = f"{tmp_path}/test_output.json"
         crawler.save_to_json(data, temp_file)
         
-        # Verify file exists
+        # Verify file exists and holds the compact msgspec encoding
         import os
-        assert os.path.exists(temp_file) 
\ No newline at end of file
+        assert os.path.exists(temp_file)
+        with open(temp_file, "rb") as f:
+            assert f.read() == msgspec.json.encode(data)
+    
+    def test_save_to_json_pretty(self, tmp_path: str) -> None:
+        """Test saving indented JSON that decodes back to the same data."""
+        per_capita = [
+            GDPPerCapita(country="Luxembourg", rank=1, gdp_per_capita=128572, year=2023),
+        ]
+        data = WikipediaGDPData(per_capita=per_capita, growth_rates=[])
+        data.combine_data()
+        
+        crawler = WikipediaGDPCrawler()
+        temp_file = f"{tmp_path}/test_output.json"
+        crawler.save_to_json(data, temp_file, pretty=True)
+        
+        with open(temp_file, "rb") as f:
+            content = f.read()
+        
+        assert content.startswith(b'{\n  "per_capita": [')
+        assert msgspec.json.decode(content, type=WikipediaGDPData) == data 
+    
+    def test_save_to_json_raises_on_write_error(self, tmp_path: str) -> None:
+        """Test that a failed write is re-raised instead of swallowed."""
+        data = WikipediaGDPData(per_capita=[], growth_rates=[])
+        crawler = WikipediaGDPCrawler()
+        
+        # The target is a directory, so writing the file fails
+        with pytest.raises(OSError):
+            crawler.save_to_json(data, str(tmp_path))
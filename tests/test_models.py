@@ -1,6 +1,7 @@
 """Tests for the data models."""
 
 import datetime
+import gc
 from typing import Dict
 
 import msgspec
@@ -29,6 +30,11 @@ def test_gdp_per_capita_model() -> None:
     assert data.year == 2023
     assert data.source == "IMF"  # Default value
     assert data.note is None  # Default value
+    
+    # Scalar-only, immutable entries stay out of the cyclic GC
+    assert not gc.is_tracked(data)
+    with pytest.raises(AttributeError):
+        data.rank = 2  # type: ignore[misc]
 
 
 def test_gdp_growth_rate_model() -> None:
@@ -47,6 +53,7 @@ def test_gdp_growth_rate_model() -> None:
     assert data.year == 2023
     assert data.source == "IMF"  # Default value
     assert data.note == "Test note"
+    assert not gc.is_tracked(data)
 
 
 def test_country_stats_model() -> None:
@@ -67,6 +74,11 @@ def test_country_stats_model() -> None:
     assert data.gdp_growth_rate_rank == 2
     assert isinstance(data.last_updated, datetime.date)
     assert (today - data.last_updated).days <= 1  # Should be today
+    
+    # Combined stats are built whole and never modified afterwards
+    assert not gc.is_tracked(data)
+    with pytest.raises(AttributeError):
+        data.gdp_per_capita = 1.0  # type: ignore[misc]
 
 
 def test_wikipedia_gdp_data_model() -> None:
@@ -104,6 +116,7 @@ def test_combine_data() -> None:
     data.combine_data()
     
     assert len(data.combined_data) == 3  # Country A, B, and C
+    assert list(data.combined_data) == ["Country A", "Country B", "Country C"]
     
     # Check Country A with both data points
     country_a = data.combined_data["Country A"]
@@ -128,6 +141,9 @@ def test_combine_data() -> None:
     assert country_c.gdp_per_capita_rank is None
     assert country_c.gdp_growth_rate == 4.0
     assert country_c.gdp_growth_rate_rank == 1
+    
+    # All countries share a single timestamp
+    assert len({stats.last_updated for stats in data.combined_data.values()}) == 1
 
 
 def test_msgspec_serialization() -> None:
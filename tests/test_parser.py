@@ -1,7 +1,11 @@
 """Tests for the Wikipedia parser."""
 
+from typing import List, Union
+
 import pytest
+from selectolax.lexbor import LexborHTMLParser
 
+from src.models import GDPGrowthRate, GDPPerCapita
 from src.parser import WikipediaParser
 
 
@@ -59,18 +63,29 @@ GDP_GROWTH_RATE_HTML = """
 """
 
 
+@pytest.fixture(scope="module")
+def parser() -> WikipediaParser:
+    """Share one parser across tests; it only holds the default year."""
+    return WikipediaParser()
+
+
+@pytest.fixture(scope="module")
+def per_capita_tree() -> LexborHTMLParser:
+    """Parse the per-capita sample once for tests of tree-level helpers."""
+    return LexborHTMLParser(GDP_PER_CAPITA_HTML)
+
+
 def test_init() -> None:
     """Test parser initialization."""
     parser = WikipediaParser()
     assert parser.current_year == 2023
 
 
-def test_clean_country_name() -> None:
+def test_clean_country_name(parser: WikipediaParser) -> None:
     """Test country name cleaning."""
-    parser = WikipediaParser()
-    
     # Test removing footnotes
     assert parser._clean_country_name("Switzerland[a]") == "Switzerland"
+    assert parser._clean_country_name("Switzerland[n 1]") == "Switzerland"
     
     # Test removing HTML tags
     assert parser._clean_country_name("<b>Switzerland</b>") == "Switzerland"
@@ -82,10 +97,8 @@ def test_clean_country_name() -> None:
     assert parser._clean_country_name("  <i>Switzerland</i>[1]  ") == "Switzerland"
 
 
-def test_parse_float() -> None:
+def test_parse_float(parser: WikipediaParser) -> None:
     """Test floating point value parsing."""
-    parser = WikipediaParser()
-    
     # Test simple number
     assert parser._parse_float("123.45") == 123.45
     
@@ -95,73 +108,141 @@ def test_parse_float() -> None:
     # Test percentage
     assert parser._parse_float("5.4%") == 5.4
     
+    # Test currency, non-breaking spaces, and Unicode minus
+    assert parser._parse_float("$1,234\u00a0") == 1234.0
+    assert parser._parse_float("\u22121.5%") == -1.5
+    
+    # Test footnote markers
+    assert parser._parse_float("62.3[1]") == 62.3
+    
     # Test invalid input
     assert parser._parse_float("N/A") == 0.0
+    
+    # Test non-finite values that float() would otherwise accept
+    assert parser._parse_float("nan") == 0.0
+    assert parser._parse_float("NaN") == 0.0
+    assert parser._parse_float("inf") == 0.0
+    assert parser._parse_float("-Infinity") == 0.0
 
 
-def test_extract_year_from_html() -> None:
-    """Test year extraction from HTML."""
-    parser = WikipediaParser()
-    
-    # Test with a specific year in the HTML
-    html = "<h2>GDP per capita (2022)</h2>"
-    assert parser._extract_year_from_html(html) == 2022
+def test_row_cells(parser: WikipediaParser) -> None:
+    """Test that only direct cells of a row are returned."""
+    tree = LexborHTMLParser(
+        "<table><tr><th>1</th><td>Luxembourg"
+        "<table><tr><td>nested</td></tr></table>"
+        "</td><td>128,572</td></tr></table>"
+    )
+    row = tree.css_first("tr")
+    assert row is not None
+    cells = parser._row_cells(row)
     
-    # Test with no year found (should return default)
-    html = "<h2>Some other content</h2>"
-    assert parser._extract_year_from_html(html) == 2023
+    assert [cell.tag for cell in cells] == ["th", "td", "td"]
+    assert cells[2].text(strip=True) == "128,572"
 
 
-def test_parse_gdp_per_capita() -> None:
-    """Test parsing GDP per capita data."""
-    parser = WikipediaParser()
-    results = parser.parse_gdp_per_capita(GDP_PER_CAPITA_HTML)
-    
-    assert len(results) == 3
+def test_row_cells_on_sample_table(
+    parser: WikipediaParser,
+    per_capita_tree: LexborHTMLParser,
+) -> None:
+    """Test cell extraction on the rows of a parsed wikitable."""
+    header_row, first_row = per_capita_tree.css("table.wikitable tr")[:2]
     
-    # Check first entry
-    assert results[0].country == "Luxembourg"
-    assert results[0].rank == 1
-    assert results[0].gdp_per_capita == 128572
+    headers = [cell.text(strip=True) for cell in parser._row_cells(header_row)]
+    assert headers == ["Rank", "Country/Territory", "GDP per capita (US$)"]
     
-    # Check second entry
-    assert results[1].country == "Ireland"
-    assert results[1].rank == 2
-    assert results[1].gdp_per_capita == 94392
+    cells = [cell.text(strip=True) for cell in parser._row_cells(first_row)]
+    assert cells == ["1", "Luxembourg", "128,572"]
     
-    # Check third entry (with footnote)
-    assert results[2].country == "Switzerland"  # Note: footnote should be removed
-    assert results[2].rank == 3
-    assert results[2].gdp_per_capita == 84658
+    # No year in the sample's heading, so the default is used
+    assert parser._extract_year_from_tree(per_capita_tree) == 2023
 
 
-def test_parse_gdp_growth_rate() -> None:
-    """Test parsing GDP growth rate data."""
-    parser = WikipediaParser()
-    results = parser.parse_gdp_growth_rate(GDP_GROWTH_RATE_HTML)
+def test_extract_year_from_tree(parser: WikipediaParser) -> None:
+    """Test year extraction from a parsed tree."""
+    # Test with a specific year in the HTML
+    tree = LexborHTMLParser("<h2>GDP per capita (2022)</h2>")
+    assert parser._extract_year_from_tree(tree) == 2022
     
-    assert len(results) == 3
+    # Test that a year in the title wins over headings
+    tree = LexborHTMLParser(
+        "<html><head><title>GDP in 2021</title></head>"
+        "<body><h2>GDP per capita (2022)</h2></body></html>"
+    )
+    assert parser._extract_year_from_tree(tree) == 2021
     
-    # Check first entry
-    assert results[0].country == "Guyana"
-    assert results[0].rank == 1
-    assert results[0].growth_rate_percent == 62.3
+    # Test that headings outside the article body are ignored
+    tree = LexborHTMLParser(
+        "<html><body><h2>Site news 1999</h2>"
+        "<div id='mw-content-text'><h2>Growth (2024)</h2></div></body></html>"
+    )
+    assert parser._extract_year_from_tree(tree) == 2024
+    
+    # Test with no year found (should return default)
+    tree = LexborHTMLParser("<h2>Some other content</h2>")
+    assert parser._extract_year_from_tree(tree) == 2023
+
+
+@pytest.mark.parametrize(
+    "method,html,expected",
+    [
+        (
+            "parse_gdp_per_capita",
+            GDP_PER_CAPITA_HTML,
+            [
+                GDPPerCapita(country="Luxembourg", rank=1, gdp_per_capita=128572, year=2023),
+                GDPPerCapita(country="Ireland", rank=2, gdp_per_capita=94392, year=2023),
+                # Footnote should be removed
+                GDPPerCapita(country="Switzerland", rank=3, gdp_per_capita=84658, year=2023),
+            ],
+        ),
+        (
+            "parse_gdp_growth_rate",
+            GDP_GROWTH_RATE_HTML,
+            [
+                GDPGrowthRate(country="Guyana", rank=1, growth_rate_percent=62.3, year=2023),
+                # Footnote should be removed
+                GDPGrowthRate(country="Libya", rank=2, growth_rate_percent=17.9, year=2023),
+                GDPGrowthRate(country="Macao", rank=3, growth_rate_percent=17.2, year=2023),
+            ],
+        ),
+    ],
+    ids=["per_capita", "growth_rate"],
+)
+def test_parse_gdp_table(
+    parser: WikipediaParser,
+    method: str,
+    html: str,
+    expected: List[Union[GDPPerCapita, GDPGrowthRate]],
+) -> None:
+    """Test parsing each GDP table into its model entries."""
+    # Year comes from the title/headings, falling back to the default
+    assert getattr(parser, method)(html) == expected
+
+
+def test_non_wikitable_tables_ignored(parser: WikipediaParser) -> None:
+    """Test that layout tables are skipped even with a country header."""
+    layout_table = (
+        "<table><tr><th>Rank</th><th>Country</th><th>Value</th></tr>"
+        "<tr><td>1</td><td>Nowhere</td><td>1,000</td></tr></table>"
+    )
     
-    # Check second entry (with footnote)
-    assert results[1].country == "Libya"  # Note: footnote should be removed
-    assert results[1].rank == 2
-    assert results[1].growth_rate_percent == 17.9
+    per_capita = parser.parse_gdp_per_capita(layout_table + GDP_PER_CAPITA_HTML)
+    assert [r.country for r in per_capita] == ["Luxembourg", "Ireland", "Switzerland"]
     
-    # Check third entry
-    assert results[2].country == "Macao"
-    assert results[2].rank == 3
-    assert results[2].growth_rate_percent == 17.2
+    growth = parser.parse_gdp_growth_rate(layout_table + GDP_GROWTH_RATE_HTML)
+    assert [r.country for r in growth] == ["Guyana", "Libya", "Macao"]
+
+
+def test_parse_from_bytes(parser: WikipediaParser) -> None:
+    """Test that raw response bytes parse the same as decoded text."""
+    assert parser.parse_gdp_per_capita(GDP_PER_CAPITA_HTML.encode()) == \
+        parser.parse_gdp_per_capita(GDP_PER_CAPITA_HTML)
+    assert parser.parse_gdp_growth_rate(GDP_GROWTH_RATE_HTML.encode()) == \
+        parser.parse_gdp_growth_rate(GDP_GROWTH_RATE_HTML)
 
 
-def test_empty_html() -> None:
+def test_empty_html(parser: WikipediaParser) -> None:
     """Test parsing empty HTML."""
-    parser = WikipediaParser()
-    
     # Test empty HTML for GDP per capita
     results = parser.parse_gdp_per_capita("")
     assert len(results) == 0
@@ -171,10 +252,8 @@ def test_empty_html() -> None:
     assert len(results) == 0
 
 
-def test_malformed_html() -> None:
+def test_malformed_html(parser: WikipediaParser) -> None:
     """Test parsing malformed HTML."""
-    parser = WikipediaParser()
-    
     # Test malformed HTML (no rows)
     malformed_html = "<table class='wikitable'></table>"
     results = parser.parse_gdp_per_capita(malformed_html)